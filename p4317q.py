@@ -2,11 +2,22 @@
 # -*- coding: utf-8 -*-
 
 from enum import Enum, unique
-import serial
-import argparse
+import functools
+import itertools
+import operator
+import os
+import queue
+import select
+import sys
+import threading
+import types
+import weakref
+from serial import Serial as _Serial
 
 # Constant
 endian = 'big'
+reply_timeout = 0.1
+inter_byte_timeout = 0.05
 
 
 # Base Class of Exception
@@ -59,6 +70,16 @@ class CommandError(P4317qError):
     pass
 
 
+# Write Timeout
+class WriteTimeoutError(P4317qError):
+    pass
+
+
+# Port Closed while Command is being Submitted
+class PortClosedError(P4317qError):
+    pass
+
+
 # Header
 @unique
 class Header(Enum):
@@ -66,6 +87,11 @@ class Header(Enum):
     Reply = bytes([0x6f, 0x37])
 
 
+# Header Values
+_HDR_CMD_BYTES = Header.Command.value
+_HDR_REPLY_BYTES = Header.Reply.value
+
+
 # R/W
 @unique
 class ReadWrite(Enum):
@@ -118,6 +144,22 @@ class Command(Enum):
     FactoryReset = bytes([0xaf])
 
 
+def _cmd_prefix(rw, cmd, data_length):
+    """
+    Build Command Prefix (Header, Length, Read/Write and Command)
+    :param rw: Read or Write of ReadWrite type
+    :param cmd: Command of Command type
+    :param data_length: Length of Data of int type
+    :return: Command Prefix of bytes type
+    """
+    ln = len(rw.value) + len(cmd.value) + data_length
+    return _HDR_CMD_BYTES + bytes((ln,)) + rw.value + cmd.value
+
+
+# Command Prefix of every Read/Write, Command and Data Length
+_PREFIX = {(rw, cmd, n): _cmd_prefix(rw, cmd, n) for rw, cmd, n in itertools.product(ReadWrite, Command, range(0, 8))}
+
+
 # Data Length
 class DataLength(object):
     # POWER MANAGEMENT
@@ -222,44 +264,44 @@ class Window(Enum):
     Window4 = bytes([0x03])
 
 
+def _in_range(v, lo, hi):
+    """
+    Check Value is an Integer in Range
+    :param v: Value to Check
+    :param lo: Lower Limit of int type
+    :param hi: Upper Limit (exclusive) of int type
+    :return: True if v is of int type and lo <= v < hi
+    """
+    return isinstance(v, int) and lo <= v < hi
+
+
 # RGB
 class RGB(object):
-    __Red = None
-    __Green = None
-    __Blue = None
+    __slots__ = ('__Red', '__Green', '__Blue')
 
     def __init__(self, red=None, green=None, blue=None, rgb=None):
+        self.__Red = self.__Green = self.__Blue = None
         if red is not None:
-            if red in range(0, 100):
+            if _in_range(red, 0, 100):
                 self.__Red = red
             else:
                 raise ValueError
         if green is not None:
-            if green in range(0, 100):
+            if _in_range(green, 0, 100):
                 self.__Green = green
             else:
                 raise ValueError
         if blue is not None:
-            if blue in range(0, 100):
+            if _in_range(blue, 0, 100):
                 self.__Blue = blue
             else:
                 raise ValueError
         if rgb is not None:
-            v = int.from_bytes(rgb[0:1], endian)
-            if v in range(0, 100):
-                self.__Red = v
-            else:
-                raise ValueError
-            v = int.from_bytes(rgb[1:2], endian)
-            if v in range(0, 100):
-                self.__Green = v
-            else:
-                raise ValueError
-            v = int.from_bytes(rgb[2:3], endian)
-            if v in range(0, 100):
-                self.__Blue = v
-            else:
+            # Bytes are never negative, so only the upper limit is checked
+            r, g, b = rgb[0], rgb[1], rgb[2]
+            if r > 99 or g > 99 or b > 99:
                 raise ValueError
+            self.__Red, self.__Green, self.__Blue = r, g, b
 
     @property
     def red(self):
@@ -267,7 +309,7 @@ class RGB(object):
 
     @red.setter
     def red(self, v):
-        if v in range(0, 100):
+        if _in_range(v, 0, 100):
             self.__Red = v
         else:
             raise ValueError
@@ -278,7 +320,7 @@ class RGB(object):
 
     @green.setter
     def green(self, v):
-        if v in range(0, 100):
+        if _in_range(v, 0, 100):
             self.__Green = v
         else:
             raise ValueError
@@ -289,13 +331,13 @@ class RGB(object):
 
     @blue.setter
     def blue(self, v):
-        if v in range(0, 100):
+        if _in_range(v, 0, 100):
             self.__Blue = v
         else:
             raise ValueError
 
     def to_bytes(self):
-        return bytes([self.__Red, self.__Green, self.__Blue])
+        return bytes((self.__Red, self.__Green, self.__Blue))
 
     def __str__(self):
         return "Red:{} Green:{} Blue:{}".format(self.__Red, self.__Green, self.__Blue)
@@ -322,6 +364,10 @@ class ResultCode(Enum):
     OtherFailure = bytes([0x04])
 
 
+# Result Code Value of Success
+_OK_BYTE = ResultCode.Success.value[0]
+
+
 # Up Down
 class UpDown(Enum):
     Up = 1
@@ -332,10 +378,263 @@ class UpDown(Enum):
     Dec = -1
 
 
+# Enum Members in Definition Order, and Index of Each Member
+_ENUM_SEQS = {t: tuple(t) for t in (State, AspectRatio, ColorFormat, ColorPreset, VideoInput, PxPMode, PxPLocation,
+                                    Language)}
+_ENUM_INDEX = {t: {m: i for i, m in enumerate(seq)} for t, seq in _ENUM_SEQS.items()}
+_ENUM_NAMES = {t.__name__: t for t in _ENUM_SEQS}
+
+
+def _parse_int(v):
+    """
+    Parse Data as Integer
+    :param v: Data of bytes type
+    :return: Data of int type
+    """
+    return int.from_bytes(v, endian)
+
+
+def _parse_rgb(v):
+    """
+    Parse Data as RGB
+    :param v: Data of bytes type
+    :return: Data of RGB type
+    """
+    return RGB(rgb=v)
+
+
+# Reply Data Parser of each Command
+_PARSER = {
+    # MONITOR MANAGEMENT
+    Command.MonitorName: bytes.decode,
+    Command.BacklightHours: _parse_int,
+    # POWER MANAGEMENT
+    Command.PowerState: State,
+    Command.PowerLED: State,
+    Command.PowerUSB: State,
+    # IMAGE ADJUSTMENT
+    Command.Brightness: operator.itemgetter(0),
+    Command.Contrast: operator.itemgetter(0),
+    Command.AspectRatio: AspectRatio,
+    Command.Sharpness: operator.itemgetter(0),
+    # COLOR MANAGEMENT
+    Command.InputColorFormat: ColorFormat,
+    Command.ColorPreset: ColorPreset,
+    Command.CustomColor: _parse_rgb,
+    # VIDEO INPUT MANAGEMENT
+    Command.AutoSelect: State,
+    Command.VideoInput: VideoInput,
+    # PIP/PBP MANAGEMENT
+    Command.PxPMode: PxPMode,
+    Command.PxPSubInput: VideoInput,
+    Command.PxPLocation: PxPLocation,
+    # OSD MANAGEMENT
+    Command.OSDTransparency: operator.itemgetter(0),
+    Command.OSDLanguage: Language,
+    Command.OSDTimer: operator.itemgetter(0),
+    Command.OSDButtonLock: State,
+    # SYSTEM MANAGEMENT
+    Command.DDCCI: State,
+    Command.LCDConditioning: State,
+}
+
+
+def _int_prop(cmd, length, lo, hi, name):
+    """
+    Build Property of int type
+    :param cmd: Command of Command type
+    :param length: Data Length of int type
+    :param lo: Lower Limit of int type
+    :param hi: Upper Limit (exclusive) of int type
+    :param name: Setting Name of str type for Docstring
+    :return: Property
+    """
+    doc = ('Get/Set {0}\n'
+           ':param v: {0} of int type ({1}-{2}) to Set\n'
+           ':return: {0} of int type ({1}-{2})').format(name, lo, hi - 1)
+
+    def getter(self):
+        return self.query_parsed(ReadWrite.Read, cmd)
+
+    def setter(self, v):
+        if not _in_range(v, lo, hi):
+            raise ValueError
+        self.query(ReadWrite.Write, cmd, bytes((v,)) if length == 1 else v.to_bytes(length, endian))
+
+    return property(getter, setter, doc=doc)
+
+
+def _enum_prop(cmd, name):
+    """
+    Build Property of Enum type
+    :param cmd: Command of Command type, whose Enum type is registered in _PARSER
+    :param name: Setting Name of str type for Docstring
+    :return: Property
+    """
+    doc = ('Get/Set {0}\n'
+           ':param v: {0} of {1} type to Set\n'
+           ':return: {0} of {1} type').format(name, _PARSER[cmd].__name__)
+
+    def getter(self):
+        return self.query_parsed(ReadWrite.Read, cmd)
+
+    def setter(self, v):
+        self.query(ReadWrite.Write, cmd, v.value)
+
+    return property(getter, setter, doc=doc)
+
+
+class _Result(object):
+    """
+    Result of a queued Command, filled in by the I/O Thread
+    """
+    __slots__ = ('__done', '__value', '__error')
+
+    def __init__(self):
+        self.__done = threading.Event()
+        self.__value = None
+        self.__error = None
+
+    def set_result(self, v):
+        self.__value = v
+        self.__done.set()
+
+    def set_exception(self, e):
+        self.__error = e
+        self.__done.set()
+
+    def result(self):
+        """
+        Wait for the Command to be done
+        :return: Data of bytes type if exist
+        """
+        self.__done.wait()
+        if self.__error is not None:
+            raise self.__error
+        return self.__value
+
+
+class _SerialWorker(threading.Thread):
+    """
+    I/O Thread owning the Serial Port, which sends queued Commands in order and fills in their Results
+    """
+
+    def __init__(self, port, parse):
+        """
+
+        :param port: Serial Port of serial.Serial type
+        :param parse: Function taking Command and Reply of memoryview type, and returning Data
+        """
+        super().__init__(daemon=True)
+        self.__port = port
+        self.__parse = parse
+        self.__queue = queue.Queue()
+        self.__lock = threading.Lock()
+        self.__stopped = False
+        self.__rx_buf = bytearray(64)
+        self.__rx_mv = memoryview(self.__rx_buf)
+
+    def submit(self, cmd, frame):
+        """
+        Queue Command
+        :param cmd: Command of Command type
+        :param frame: Command Frame of bytes type
+        :return: Result of _Result type
+        """
+        f = _Result()
+        with self.__lock:
+            # Nothing would ever take a Command queued behind the stop sentinel
+            if self.__stopped:
+                raise PortClosedError
+            self.__queue.put((cmd, frame, f))
+        return f
+
+    def stop(self):
+        """
+        Stop after the queued Commands are done
+        :return: None
+        """
+        with self.__lock:
+            if not self.__stopped:
+                self.__stopped = True
+                self.__queue.put(None)
+        self.join()
+
+    def run(self):
+        while True:
+            item = self.__queue.get()
+            if item is None:
+                return
+            cmd, frame, f = item
+            try:
+                f.set_result(self.__transact(cmd, frame))
+            except Exception as e:
+                f.set_exception(e)
+
+    @staticmethod
+    def __read_into(fd, mv, n, size, timeout):
+        """
+        Read into Buffer until it holds size bytes or the line stays idle
+        :param fd: File Descriptor of Serial Port
+        :param mv: Buffer of memoryview type
+        :param n: Number of bytes already in Buffer
+        :param size: Number of bytes wanted in Buffer
+        :param timeout: Idle Timeout in seconds
+        :return: Number of bytes in Buffer
+        """
+        while n < size:
+            r, _, _ = select.select([fd], [], [], timeout)
+            if not r:
+                break
+            k = os.readv(fd, [mv[n:size]])
+            if not k:
+                break
+            n += k
+        return n
+
+    @staticmethod
+    def __write_all(fd, frame, timeout):
+        """
+        Write whole Frame, as the non-blocking fd may take only part of it
+        :param fd: File Descriptor of Serial Port
+        :param frame: Command Frame of bytes type
+        :param timeout: Timeout in seconds to wait for the fd to be writable
+        :return: None
+        """
+        mv = memoryview(frame)
+        while mv:
+            _, w, _ = select.select([], [fd], [], timeout)
+            if not w:
+                raise WriteTimeoutError
+            mv = mv[os.write(fd, mv):]
+
+    def __transact(self, cmd, frame):
+        """
+        Send Command Frame and Parse its Reply
+        :param cmd: Command of Command type
+        :param frame: Command Frame of bytes type
+        :return: Data of bytes type if exist
+        """
+        fd = self.__port.fd
+
+        # Drop late replies to earlier commands, so they are not taken for this one
+        self.__port.reset_input_buffer()
+        self.__write_all(fd, frame, reply_timeout)
+
+        # Read Header and Length, then exactly the rest of the frame
+        mv = self.__rx_mv
+        n = self.__read_into(fd, mv, 0, 3, reply_timeout)
+        if n == 3:
+            n = self.__read_into(fd, mv, n, min(mv[2] + 4, len(mv)), inter_byte_timeout)
+
+        return self.__parse(cmd, mv[:n])
+
+
 class P4317Q(object):
     """
     DELL P4317Q
     """
+    __slots__ = ('__serial', '__port', '__worker', '__finalizer', '__lock', '__weakref__')
 
     def __init__(self, s):
         """
@@ -343,6 +642,65 @@ class P4317Q(object):
         :param s: Serial Port Device Name of str type
         """
         self.__serial = s
+        self.__port = None
+        self.__worker = None
+        self.__finalizer = None
+        # Reentrant, as _worker opens the port through _port
+        self.__lock = threading.RLock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _port(self):
+        """
+        Get Serial Port, opening it on first use
+        :return: Serial Port of serial.Serial type
+        """
+        with self.__lock:
+            if self.__port is None:
+                self.__port = _Serial(port=self.__serial, timeout=reply_timeout)
+            return self.__port
+
+    def _worker(self):
+        """
+        Get I/O Thread owning the Serial Port, starting it on first use
+        :return: I/O Thread of _SerialWorker type
+        """
+        with self.__lock:
+            if self.__worker is None:
+                # Neither the I/O Thread nor the finalizer may refer to self, or self would never be collected
+                self.__worker = _SerialWorker(port=self._port(), parse=self.__parse_reply)
+                self.__worker.start()
+                self.__finalizer = weakref.finalize(self, self.__release, self.__worker, self.__port)
+            return self.__worker
+
+    @staticmethod
+    def __release(worker, port):
+        """
+        Stop I/O Thread and Close Serial Port
+        :param worker: I/O Thread of _SerialWorker type
+        :param port: Serial Port of serial.Serial type
+        :return: None
+        """
+        worker.stop()
+        port.close()
+
+    def close(self):
+        """
+        Stop I/O Thread and Close Serial Port if opened
+        :return: None
+        """
+        with self.__lock:
+            if self.__finalizer is not None:
+                self.__finalizer()
+            elif self.__port is not None:
+                self.__port.close()
+            self.__finalizer = None
+            self.__worker = None
+            self.__port = None
 
     @staticmethod
     def __calc_check_sum(v):
@@ -351,10 +709,7 @@ class P4317Q(object):
         :param v: Command of bytes type
         :return: Checksum of bytes type
         """
-        s = 0
-        for i in v:
-            s ^= i
-        return s.to_bytes(1, endian)
+        return bytes((functools.reduce(operator.xor, v, 0),))
 
     def __build_cmd(self, rw, cmd, data=bytes()):
         """
@@ -362,64 +717,65 @@ class P4317Q(object):
         :param rw: Read or Write of ReadWrite type (not bytes type)
         :param cmd: Command of Command type (not bytes type)
         :param data: data of bytes type if needed
-        :return: Command of bytearray type
+        :return: Command of bytes type
         """
-        c = bytearray()
-
-        # Add Header
-        c.extend(Header.Command.value)
-
-        # Add Length
-        c.extend((len(rw.value) + len(cmd.value) + len(data)).to_bytes(1, endian))
-
-        # Add Read/Write
-        c.extend(rw.value)
-
-        # Add Command
-        c.extend(cmd.value)
-
-        # Add Data
-        c.extend(data)
+        try:
+            c = _PREFIX[(rw, cmd, len(data))] + data
+        except KeyError:
+            c = _cmd_prefix(rw, cmd, len(data)) + data
 
         # Add CheckSum
-        c.extend(self.__calc_check_sum(c))
-
-        return c
+        return c + self.__calc_check_sum(c)
 
-    def __parse_reply(self, cmd, reply):
+    @staticmethod
+    def __parse_reply(cmd, reply):
         """
         Parse Reply
         :param cmd: Command of Command type
-        :param reply: Reply of bytes type
+        :param reply: Reply of bytes-like type
         :return: Data of bytes type if exist
         """
+        mv = memoryview(reply)
+
         # Check header
-        if reply[0:2] != Header.Reply.value:
+        if mv[0:2] != _HDR_REPLY_BYTES:
             raise HeaderError
 
         # Check Length
-        ln = int.from_bytes(reply[2:3], endian)
-        if ln != len(reply)-4:
+        if len(reply) < 4 or reply[2] != len(reply)-4:
             raise LengthError
+        ln = reply[2]
+        if ln < 3:
+            raise FormatError
 
         # Check Reply
-        if reply[3:4] != bytes([0x02]):
+        if reply[3] != 0x02:
             raise FormatError
 
         # Check Result Code
-        if reply[4:5] != ResultCode.Success.value:
-            raise ResultCodeError(int.from_bytes(reply[4:5], endian))
+        if reply[4] != _OK_BYTE:
+            raise ResultCodeError(reply[4])
 
         # Check Command
-        if reply[5:6] != cmd.value:
+        if mv[5:6] != cmd.value:
             raise CommandError
 
         # Check Checksum
-        if reply[ln+3:ln+4] != self.__calc_check_sum(reply[0:ln+3]):
+        if mv[ln+3:ln+4] != P4317Q.__calc_check_sum(mv[0:ln+3]):
             raise ChecksumError
 
         # Return Data if exist(Length if greater than 4)
-        return None if ln < 4 else reply[6:ln+3]
+        return None if ln < 4 else bytes(mv[6:ln+3])
+
+    def submit(self, rw, cmd, data=bytes()):
+        """
+        Submit Command to the I/O Thread without waiting for the Reply
+        :param rw: Read or Write of ReadWrite type
+        :param cmd: Command of Command type
+        :param data: Data of bytes type, or of any type bytes() accepts
+        :return: Result of _Result type, whose result() waits for Data of bytes type if exist
+        """
+        return self._worker().submit(cmd, self.__build_cmd(rw=rw, cmd=cmd, data=bytes(data)))
 
     def query(self, rw, cmd, data=bytes()):
         """
@@ -429,39 +785,70 @@ class P4317Q(object):
         :param data: Data of bytes type
         :return: Data of bytes type if exist
         """
-        with serial.Serial(port=self.__serial, timeout=0.1) as s:
-            s.reset_output_buffer()
-            s.reset_input_buffer()
-            s.write(self.__build_cmd(rw=rw, cmd=cmd, data=bytes(data)))
-            s.flush()
-            return self.__parse_reply(cmd=cmd, reply=s.read(64))
+        return self.submit(rw, cmd, data).result()
+
+    def query_parsed(self, rw, cmd, data=bytes()):
+        """
+        Query Command and Parse Data with the Parser registered for it
+        :param rw: Read or Write of ReadWrite type
+        :param cmd: Command of Command type
+        :param data: Data of bytes type
+        :return: Data of Specific type, or of bytes type if no Parser is registered
+        """
+        r = self.query(rw, cmd, data)
+        parser = _PARSER.get(cmd)
+        return r if parser is None else parser(r)
+
+    @staticmethod
+    def __parse_value(v):
+        """
+        Parse Value given as Text
+        :param v: Value of str type such as "50", "State.On", or "10,20,30" / "RGB(10,20,30)" for Custom Color
+        :return: Value of int, Enum or RGB type
+        """
+        try:
+            return int(v)
+        except ValueError:
+            pass
+        if v.startswith('RGB(') and v.endswith(')'):
+            v = v[4:-1]
+        if ',' in v:
+            rgb = v.split(',')
+            if len(rgb) != 3:
+                raise ValueError(v)
+            return RGB(*(int(c) for c in rgb))
+        t, _, m = v.partition('.')
+        try:
+            return _ENUM_NAMES[t][m]
+        except KeyError:
+            raise ValueError(v)
 
     def set_value(self, n, v=None, ud=None):
         """
         Set Value
         :param n: Member Name of str type
-        :param v: Value to Set of Specific type
+        :param v: Value to Set of Specific type, or of str type to be parsed (see __parse_value)
         :param ud: Up or Down of UpDown type
         :return: Value after change
         """
         if v is not None:
-            exec('self.{}={}'.format(n, v))
+            if isinstance(v, str):
+                v = self.__parse_value(v)
+            setattr(self, n, v)
             new = v
         elif ud is not None:
-            old = eval('self.{}'.format(n))
-            type = old.__class__.__name__
-            if type == 'int':
+            old = getattr(self, n)
+            if isinstance(old, int):
                 new = old + ud.value
                 try:
-                    exec('self.{}={}'.format(n, new))
+                    setattr(self, n, new)
                 except ValueError:
                     new = old
             else:
-                try:
-                    new = eval('{}(list({})[list({}).index(old)+ud.value])'.format(type, type, type))
-                except IndexError:
-                    new = eval('{}[0] if 0 <= ud.value else {}[-1]'.format(type, type))
-                exec('self.{}={}'.format(n, new))
+                seq = _ENUM_SEQS[type(old)]
+                i = _ENUM_INDEX[type(old)][old] + ud.value
+                new = seq[max(0, min(len(seq) - 1, i))]
+                setattr(self, n, new)
         else:
             raise ValueError
         return new
@@ -472,7 +859,7 @@ class P4317Q(object):
         :param n: Member Name of str type
         :return: Value of Specific type
         """
-        return eval('self.{}'.format(n))
+        return getattr(self, n)
 
     # MONITOR MANAGEMENT
 
@@ -490,7 +877,7 @@ class P4317Q(object):
         Get Monitor Name
         :return: Monitor Name of string type
         """
-        return self.query(ReadWrite.Read, Command.MonitorName).decode()
+        return self.query_parsed(ReadWrite.Read, Command.MonitorName)
 
     @property
     def monitor_serial_number(self):
@@ -506,60 +893,13 @@ class P4317Q(object):
         Get Backlight Hours
         :return: Backlight Hours of int type
         """
-        return int.from_bytes(self.query(ReadWrite.Read, Command.BacklightHours), endian)
+        return self.query_parsed(ReadWrite.Read, Command.BacklightHours)
 
     # POWER MANAGEMENT
 
-    @property
-    def power_state(self):
-        """
-        Get Power State
-        :return: Power State of State type
-        """
-        return State(self.query(ReadWrite.Read, Command.PowerState))
-
-    @power_state.setter
-    def power_state(self, v):
-        """
-        Set Power State
-        :param v: Power State of State type
-        :return: None
-        """
-        self.query(ReadWrite.Write, Command.PowerState, v.value)
-
-    @property
-    def power_led(self):
-        """
-        Get Power LED
-        :return: Power LED of State type
-        """
-        return State(self.query(ReadWrite.Read, Command.PowerLED))
-
-    @power_led.setter
-    def power_led(self, v):
-        """
-        Set Power LED
-        :param v: Power LED of State type
-        :return: None
-        """
-        self.query(ReadWrite.Write, Command.PowerLED, v.value)
-
-    @property
-    def power_usb(self):
-        """
-        Get Power USB
-        :return: Power USB of State Type
-        """
-        return State(self.query(ReadWrite.Read, Command.PowerUSB))
-
-    @power_usb.setter
-    def power_usb(self, v):
-        """
-        Set Power USB
-        :param v: Power USB of State Type
-        :return: None
-        """
-        self.query(ReadWrite.Write, Command.PowerUSB, v.value)
+    power_state = _enum_prop(Command.PowerState, 'Power State')
+    power_led = _enum_prop(Command.PowerLED, 'Power LED')
+    power_usb = _enum_prop(Command.PowerUSB, 'Power USB')
 
     def reset_power(self):
         """
@@ -570,96 +910,14 @@ class P4317Q(object):
 
     # IMAGE ADJUSTMENT
 
-    @property
-    def brightness(self):
-        """
-        Get Brightness
-        :return: Brightness of int type
-        """
-        return int.from_bytes(self.query(ReadWrite.Read, Command.Brightness), endian)
-
-    @brightness.setter
-    def brightness(self, v):
-        """
-        Set Brightness
-        :param v: Brightness of int type
-        :return: None
-        """
-        if v not in range(0, 100):
-            raise ValueError
-        self.query(ReadWrite.Write, Command.Brightness, v.to_bytes(DataLength.Brightness, endian))
-
-    @property
-    def contrast(self):
-        """
-        Get Contrast
-        :return: Contrast of int type
-        """
-        return int.from_bytes(self.query(ReadWrite.Read, Command.Contrast), endian)
-
-    @contrast.setter
-    def contrast(self, v):
-        """
-        Set Contrast
-        :param v: Contrast of int type
-        :return: None
-        """
-        if v not in range(0, 100):
-            raise ValueError
-        self.query(ReadWrite.Write, Command.Contrast, v.to_bytes(DataLength.Contrast, endian))
-
-    @property
-    def aspect_ratio(self):
-        """
-        Get Aspect Ratio
-        :return: Aspect Ratio of AspectRatio type
-        """
-        return AspectRatio(self.query(ReadWrite.Read, Command.AspectRatio))
-
-    @aspect_ratio.setter
-    def aspect_ratio(self, v):
-        """
-        Set Aspect Ratio
-       :param v: Aspect Ratio of AspectRatio type
-        :return: None
-        """
-        self.query(ReadWrite.Write, Command.AspectRatio, v.value)
-
-    @property
-    def sharpness(self):
-        """
-        Get Sharpness
-        :return: Sharpness of int type
-        """
-        return int.from_bytes(self.query(ReadWrite.Read, Command.Sharpness), endian)
-
-    @sharpness.setter
-    def sharpness(self, v):
-        """
-        Set Sharpness
-        :param v: Sharpness of int type
-        :return: None
-        """
-        self.query(ReadWrite.Write, Command.Sharpness, v.to_bytes(DataLength.Sharpness, endian))
+    brightness = _int_prop(Command.Brightness, DataLength.Brightness, 0, 100, 'Brightness')
+    contrast = _int_prop(Command.Contrast, DataLength.Contrast, 0, 100, 'Contrast')
+    aspect_ratio = _enum_prop(Command.AspectRatio, 'Aspect Ratio')
+    sharpness = _int_prop(Command.Sharpness, DataLength.Sharpness, 0, 100, 'Sharpness')
 
     # COLOR MANAGEMENT
 
-    @property
-    def input_color_format(self):
-        """
-        Get Input Color Format
-        :return: Color Format of ColorFormat type
-        """
-        return ColorFormat(self.query(ReadWrite.Read, Command.InputColorFormat))
-
-    @input_color_format.setter
-    def input_color_format(self, v):
-        """
-        Set Input Color Format
-        :param v: Color Format of ColorFormat type
-        :return: None
-        """
-        self.query(ReadWrite.Write, Command.InputColorFormat, v.value)
+    input_color_format = _enum_prop(Command.InputColorFormat, 'Input Color Format')
 
     @property
     def color_preset_caps(self):
@@ -669,22 +927,7 @@ class P4317Q(object):
         """
         return self.query(ReadWrite.Read, Command.ColorPresetCaps)
 
-    @property
-    def color_preset(self):
-        """
-        Get Color Preset
-        :return: Color Preset of ColorPreset type
-        """
-        return ColorPreset(self.query(ReadWrite.Read, Command.ColorPreset))
-
-    @color_preset.setter
-    def color_preset(self, v):
-        """
-        Set Color Preset
-        :param v: Color Preset of ColorPreset type
-        :return: None
-        """
-        self.query(ReadWrite.Write, Command.ColorPreset, v.value)
+    color_preset = _enum_prop(Command.ColorPreset, 'Color Preset')
 
     @property
     def custom_color(self):
@@ -692,7 +935,7 @@ class P4317Q(object):
         Get Custom Color
         :return: Custom Color of RGB type
         """
-        return RGB(rgb=self.query(ReadWrite.Read, Command.CustomColor))
+        return self.query_parsed(ReadWrite.Read, Command.CustomColor)
 
     @custom_color.setter
     def custom_color(self, v):
@@ -712,22 +955,7 @@ class P4317Q(object):
 
     # VIDEO INPUT MANAGEMENT
 
-    @property
-    def auto_select(self):
-        """
-        Get Auto Select
-        :return: Auto Select of State type
-        """
-        return State(self.query(ReadWrite.Read, Command.AutoSelect))
-
-    @auto_select.setter
-    def auto_select(self, v):
-        """
-        Set Auto Select
-        :param v: Auto Select of State type
-        :return: None
-        """
-        self.query(ReadWrite.Write, Command.AutoSelect, v.value)
+    auto_select = _enum_prop(Command.AutoSelect, 'Auto Select')
 
     @property
     def video_input_caps(self):
@@ -737,41 +965,11 @@ class P4317Q(object):
         """
         return self.query(ReadWrite.Read, Command.VideoInputCaps)
 
-    @property
-    def video_input(self):
-        """
-        Get Video Input
-        :return: Video Input of VideoInput type
-        """
-        return VideoInput(self.query(ReadWrite.Read, Command.VideoInput))
-
-    @video_input.setter
-    def video_input(self, v):
-        """
-        Set Video Input
-        :param v: Video Input of VideoInput type
-        :return: None
-        """
-        self.query(ReadWrite.Write, Command.VideoInput, v.value)
+    video_input = _enum_prop(Command.VideoInput, 'Video Input')
 
     # PIP/PBP MANAGEMENT
 
-    @property
-    def pxp_mode(self):
-        """
-        Get PxP Mode
-        :return: PxP Mode of PxPMode type
-        """
-        return State(self.query(ReadWrite.Read, Command.PxPMode))
-
-    @pxp_mode.setter
-    def pxp_mode(self, v):
-        """
-        Set PxP Mode
-        :param v: PxP Mode of PxPMode type
-        :return: None
-        """
-        self.query(ReadWrite.Write, Command.PxPMode, v.value)
+    pxp_mode = _enum_prop(Command.PxPMode, 'PxP Mode')
 
     def get_pxp_sub_input(self, win):
         """
@@ -779,7 +977,7 @@ class P4317Q(object):
         :param win: Window of Window type to Get
         :return: PxP Sub Input of VideoInput type
         """
-        return VideoInput(self.query(ReadWrite.Read, Command.PxPSubInput, win.value))
+        return self.query_parsed(ReadWrite.Read, Command.PxPSubInput, win.value)
 
     @property
     def pxp_sub_input_win1(self):
@@ -820,7 +1018,7 @@ class P4317Q(object):
         :param v: PxP Sub Input of VideoInput type
         :return: None
         """
-        self.query(ReadWrite.Write, Command.PxPSubInput, bytearray().join(win.value).join(v.value))
+        self.query(ReadWrite.Write, Command.PxPSubInput, win.value + v.value)
 
     @pxp_sub_input_win1.setter
     def pxp_sub_input_win1(self, v):
@@ -858,96 +1056,14 @@ class P4317Q(object):
         """
         self.set_pxp_sub_input(win=Window.Window4, v=v)
 
-    @property
-    def pxp_location(self):
-        """
-        Get PxP Location
-        :return: PxP Location of PxPLocation type
-        """
-        return PxPLocation(self.query(ReadWrite.Read, Command.PxPLocation))
-
-    @pxp_location.setter
-    def pxp_location(self, v):
-        """
-        Set PxP Location
-        :param v: PxP Location of PxPLocation type
-        :return: None
-        """
-        self.query(ReadWrite.Write, Command.PxPLocation, v.value)
+    pxp_location = _enum_prop(Command.PxPLocation, 'PxP Location')
 
     # OSD MANAGEMENT
 
-    @property
-    def osd_transparency(self):
-        """
-        Get OSD Transparency
-        :return: OSD Transparency of int type
-        """
-        return int.from_bytes(self.query(ReadWrite.Read, Command.OSDTransparency), endian)
-
-    @osd_transparency.setter
-    def osd_transparency(self, v):
-        """
-        Set OSD Transparency
-        :param v: OSD Transparency of int type
-        :return: None
-        """
-        if v not in range(0, 100):
-            raise ValueError
-        self.query(ReadWrite.Write, Command.OSDTransparency, v.to_bytes(DataLength.OSDTransparency, endian))
-
-    @property
-    def osd_language(self):
-        """
-        Get OSD Language
-        :return: OSD Language of Language type
-        """
-        return Language(self.query(ReadWrite.Read, Command.OSDLanguage))
-
-    @osd_language.setter
-    def osd_language(self, v):
-        """
-        Set OSD Language
-        :param v: LSD Language of Language type
-        :return: None
-        """
-        self.query(ReadWrite.Write, Command.OSDLanguage, v.value)
-
-    @property
-    def osd_timer(self):
-        """
-        Get OSD Timer
-        :return: OSD Time of int type
-        """
-        return int.from_bytes(self.query(ReadWrite.Read, Command.OSDTimer), endian)
-
-    @osd_timer.setter
-    def osd_timer(self, v):
-        """
-        Set OSD Timer
-        :param v: OSD Timer of int type
-        :return: None
-        """
-        if v not in range(5, 60):
-            raise ValueError
-        self.query(ReadWrite.Write, Command.OSDTimer, v.to_bytes(DataLength.OSDTimer, endian))
-
-    @property
-    def osd_button_lock(self):
-        """
-        Get OSD Button Lock
-        :return: OSD Button Lock of State type
-        """
-        return State(self.query(ReadWrite.Read, Command.OSDButtonLock))
-
-    @osd_button_lock.setter
-    def osd_button_lock(self, v):
-        """
-        Set OSD Button Lock
-        :param v: OSD Button Lock of State type
-        :return: None
-        """
-        self.query(ReadWrite.Write, Command.OSDButtonLock, v.value)
+    osd_transparency = _int_prop(Command.OSDTransparency, DataLength.OSDTransparency, 0, 100, 'OSD Transparency')
+    osd_language = _enum_prop(Command.OSDLanguage, 'OSD Language')
+    osd_timer = _int_prop(Command.OSDTimer, DataLength.OSDTimer, 5, 60, 'OSD Timer')
+    osd_button_lock = _enum_prop(Command.OSDButtonLock, 'OSD Button Lock')
 
     def reset_osd(self):
         """
@@ -966,39 +1082,8 @@ class P4317Q(object):
         """
         return str(self.query(ReadWrite.Read, Command.VersionFirmware))
 
-    @property
-    def ddcci(self):
-        """
-        Get DDCCI
-        :return: DDCCI of State type
-        """
-        return State(self.query(ReadWrite.Read, Command.DDCCI))
-
-    @ddcci.setter
-    def ddcci(self, v):
-        """
-        Set DDCCI
-        :param v: DDCCI of State type
-        :return: None
-        """
-        self.query(ReadWrite.Write, Command.DDCCI, v.value)
-
-    @property
-    def lcd_conditioning(self):
-        """
-        Get LCD Conditioning
-        :return: LCD Conditioning of State type
-        """
-        return State(self.query(ReadWrite.Read, Command.LCDConditioning))
-
-    @lcd_conditioning.setter
-    def lcd_conditioning(self, v):
-        """
-        Set LCD Conditioning
-        :param v: LCD Conditioning of State type
-        :return: None
-        """
-        self.query(ReadWrite.Write, Command.LCDConditioning, v.value)
+    ddcci = _enum_prop(Command.DDCCI, 'DDCCI')
+    lcd_conditioning = _enum_prop(Command.LCDConditioning, 'LCD Conditioning')
 
     def factory_reset(self):
         """
@@ -1009,19 +1094,23 @@ class P4317Q(object):
 
 
 def get_func(args):
-    print(P4317Q(s=args.device).get_value(args.type[0]))
+    with P4317Q(s=args.device) as p4317q:
+        print(p4317q.get_value(args.type[0]))
 
 
 def set_func(args):
-    P4317Q(s=args.device).set_value(args.type[0], v=args.value)
+    with P4317Q(s=args.device) as p4317q:
+        p4317q.set_value(args.type[0], v=args.value[0])
 
 
 def up_func(args):
-    P4317Q(s=args.device).set_value(args.type[0], ud=UpDown.Up)
+    with P4317Q(s=args.device) as p4317q:
+        p4317q.set_value(args.type[0], ud=UpDown.Up)
 
 
 def down_func(args):
-    P4317Q(s=args.device).set_value(args.type[0], ud=UpDown.Down)
+    with P4317Q(s=args.device) as p4317q:
+        p4317q.set_value(args.type[0], ud=UpDown.Down)
 
 
 def search_func(args):
@@ -1029,12 +1118,57 @@ def search_func(args):
         def __init__(self, v):
             self.value = v
 
-    p4317q = P4317Q(s=args.device)
-    for c in range(0, 0xff):
-        try:
-            print('{} : {}'.format(hex(c), p4317q.query(rw=ReadWrite.Read, cmd=FakeCommand(bytes([c])))))
-        except P4317qError:
-            pass
+    with P4317Q(s=args.device) as p4317q:
+        # Queue every probe first, so the next frame is ready as soon as the previous reply is read
+        results = [(c, p4317q.submit(rw=ReadWrite.Read, cmd=FakeCommand(bytes([c])))) for c in range(0, 0x100)]
+        for c, f in results:
+            try:
+                print('{} : {}'.format(hex(c), f.result()))
+            except P4317qError:
+                pass
+
+
+# Sub Command Function and its Options
+_SUB_COMMANDS = {
+    'get': (get_func, ('type',)),
+    'set': (set_func, ('type', 'value')),
+    'up': (up_func, ('type',)),
+    'down': (down_func, ('type',)),
+    'search': (search_func, ()),
+}
+
+
+def _parse_args_fast(argv):
+    """
+    Parse Common Command Lines without argparse
+    :param argv: Arguments of list type without Program Name
+    :return: Arguments shaped like argparse's, or None if argparse is needed
+    """
+    args = types.SimpleNamespace(device='/dev/ttyS0')
+    func, names, allowed = None, (), ('device',)
+    i = 0
+    while i < len(argv):
+        a = argv[i]
+        i += 1
+        if func is None and a in _SUB_COMMANDS:
+            func, names = _SUB_COMMANDS[a]
+            allowed = names
+            continue
+        if not a.startswith('--'):
+            return None
+        k, eq, v = a[2:].partition('=')
+        if k not in allowed:
+            return None
+        if not eq:
+            if i >= len(argv):
+                return None
+            v = argv[i]
+            i += 1
+        setattr(args, k, v if k == 'device' else [v])
+    if func is None or not all(hasattr(args, n) for n in names):
+        return None
+    args.func = func
+    return args
 
 
 def main():
@@ -1042,34 +1176,40 @@ def main():
     Main Function
     :return: None
     """
-    # Setup Parser
-    parser = argparse.ArgumentParser(description='DELL P4317Q Monitor Controller.',
-                                     formatter_class=argparse.ArgumentDefaultsHelpFormatter)
-    parser.add_argument('--device', dest='device', default='/dev/ttyS0', help='serial device name.')
-    parser.add_argument('--version', action='version', version='%(prog)s 1.0.0')
-    subparsers = parser.add_subparsers()
-    parser_get = subparsers.add_parser('get', description='get value.')
-    parser_get.add_argument('--type', nargs=1, metavar='TYPE', dest='type', help='setting type.', required=True)
-    parser_get.set_defaults(func=get_func)
-    parser_set = subparsers.add_parser('set', description='set value.',)
-    parser_set.add_argument('--type', nargs=1, metavar='TYPE', dest='type', help='setting type.', required=True)
-    parser_set.add_argument('--value', nargs=1, metavar='VALUE', dest='value', help='setting value.', required=True)
-    parser_set.set_defaults(func=set_func)
-    parser_up = subparsers.add_parser('up', description='up value.')
-    parser_up.add_argument('--type', nargs=1, metavar='TYPE', dest='type', help='setting type.', required=True)
-    parser_up.set_defaults(func=up_func)
-    parser_down = subparsers.add_parser('down', description='down value.')
-    parser_down.add_argument('--type', nargs=1, metavar='TYPE', dest='type', help='setting type.', required=True)
-    parser_down.set_defaults(func=down_func)
-    parser_search = subparsers.add_parser('search')
-    parser_search.set_defaults(func=search_func)
-    args = parser.parse_args()
+    # Parse Common Command Lines directly, and anything else (help, version, errors) with argparse
+    args = _parse_args_fast(sys.argv[1:])
+    if args is None:
+        import argparse
+
+        # Setup Parser
+        parser = argparse.ArgumentParser(description='DELL P4317Q Monitor Controller.',
+                                         formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+        parser.add_argument('--device', dest='device', default='/dev/ttyS0', help='serial device name.')
+        parser.add_argument('--version', action='version', version='%(prog)s 1.0.0')
+        subparsers = parser.add_subparsers()
+        parser_get = subparsers.add_parser('get', description='get value.')
+        parser_get.add_argument('--type', nargs=1, metavar='TYPE', dest='type', help='setting type.', required=True)
+        parser_get.set_defaults(func=get_func)
+        parser_set = subparsers.add_parser('set', description='set value.',)
+        parser_set.add_argument('--type', nargs=1, metavar='TYPE', dest='type', help='setting type.', required=True)
+        parser_set.add_argument('--value', nargs=1, metavar='VALUE', dest='value', help='setting value.',
+                                required=True)
+        parser_set.set_defaults(func=set_func)
+        parser_up = subparsers.add_parser('up', description='up value.')
+        parser_up.add_argument('--type', nargs=1, metavar='TYPE', dest='type', help='setting type.', required=True)
+        parser_up.set_defaults(func=up_func)
+        parser_down = subparsers.add_parser('down', description='down value.')
+        parser_down.add_argument('--type', nargs=1, metavar='TYPE', dest='type', help='setting type.', required=True)
+        parser_down.set_defaults(func=down_func)
+        parser_search = subparsers.add_parser('search')
+        parser_search.set_defaults(func=search_func)
+        args = parser.parse_args()
+        if not hasattr(args, 'func'):
+            parser.print_help()
+            return
 
     # Execute Command
-    if hasattr(args, 'func'):
-        args.func(args)
-    else:
-        parser.print_help()
+    args.func(args)
 
 
 if __name__ == "__main__":